@@ -3,13 +3,14 @@ Relations package for Python ORM-style relationship management.
 Provides a flexible, type-safe way to define and manage model relationships.
 """
 
-from .base import RelationManagementMixin
+from .base import RelationManagementMixin, finalize
 from .cache import CacheConfig, GlobalCacheConfig
 from .descriptors import BelongsTo, HasOne, HasMany, RelationDescriptor
 from .interfaces import RelationLoader
 
 __all__ = [
     'RelationManagementMixin',
+    'finalize',
     'CacheConfig',
     'GlobalCacheConfig',
     'BelongsTo',
@@ -3,21 +3,171 @@ Base classes for relation management.
 Provides core descriptor and mixin implementations.
 """
 
-from typing import Optional, List
+import weakref
+from collections import ChainMap, deque
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Mapping, Optional, Sequence, Tuple, Type
 
 from .descriptors import RelationDescriptor
 from .interfaces import RelationManagementInterface
 
+# Relations that could not be resolved when their owner class was created,
+# as (owner reference, relation name) pairs. Only names are held, so queued
+# entries never keep a model, its loader or its cache alive.
+_pending_resolutions: Deque[Tuple['weakref.ref[type]', str]] = deque()
+
+# Queue length at which dead and resolved entries are next pruned
+_prune_at = 64
+
+# Models created so far in each defining scope, keyed by (module, qualname
+# prefix). Only consulted while a class is being created, to resolve names
+# that are not module globals yet, such as classes defined in a function.
+_scope_models: Dict[Tuple[str, str], 'weakref.WeakValueDictionary[str, type]'] = {}
+
+
+def _model_scope(cls: Type[Any]) -> Tuple[str, str]:
+    """Return the (module, enclosing qualname) scope a class is defined in."""
+    return cls.__module__, cls.__qualname__.rpartition('.')[0]
+
+
+def _enter_scope(cls: Type[Any]) -> Mapping[str, type]:
+    """
+    Add a newly created class to the models of its defining scope.
+
+    A name that is already present means the defining code is running
+    again, e.g. another call of the same factory function, so the scope
+    starts over and earlier classes are not matched with the new ones.
+
+    Returns:
+        Mapping[str, type]: Models of the scope, including ``cls``
+    """
+    scope = _model_scope(cls)
+    models = _scope_models.get(scope)
+    if models is None or cls.__name__ in models:
+        models = _scope_models[scope] = weakref.WeakValueDictionary()
+    models[cls.__name__] = cls
+    return models
+
+
+def _resolve_pending_in_scope(scope: Tuple[str, str], namespace: Mapping[str, Any]) -> None:
+    """Retry queued relations whose owner is defined in ``scope``."""
+    remaining = []
+    for entry in _pending_resolutions:
+        pending = _pending_relation(entry)
+        if pending is None:
+            continue
+        owner, relation = pending
+        if _model_scope(owner) == scope:
+            try:
+                relation.get_related_model(owner, namespace)
+                continue
+            except (NameError, ValueError):
+                pass
+        remaining.append(entry)
+    _pending_resolutions.clear()
+    _pending_resolutions.extend(remaining)
+
+
+def _pending_relation(entry: Tuple['weakref.ref[type]', str]) -> Optional[Tuple[Type[Any], RelationDescriptor]]:
+    """Return (owner, relation) for a queued entry, or None if no longer pending."""
+    owner_ref, name = entry
+    owner = owner_ref()
+    if owner is None:
+        return None
+    relation = owner.get_relation(name)
+    if relation is None or relation._resolved:
+        return None
+    return owner, relation
+
+
+def _queue_resolution(owner: Type[Any], name: str) -> None:
+    """Queue a relation for ``finalize()``, pruning stale entries as the queue grows."""
+    global _prune_at
+    if len(_pending_resolutions) >= _prune_at:
+        live = [entry for entry in _pending_resolutions if _pending_relation(entry) is not None]
+        _pending_resolutions.clear()
+        _pending_resolutions.extend(live)
+        _prune_at = max(64, 2 * len(live))
+    _pending_resolutions.append((weakref.ref(owner), name))
+
+
+def finalize(namespace: Optional[Mapping[str, Any]] = None) -> None:
+    """
+    Resolve all relations deferred at class creation.
+
+    Call once every model module has been imported, e.g. at application
+    start-up or in each worker process, so that no relation pays for model
+    resolution on first access. Every queued relation is attempted; those
+    that fail stay queued and the first error is raised afterwards.
+
+    Args:
+        namespace: Extra names to resolve forward references against,
+            e.g. models created in a function that are not module globals
+
+    Raises:
+        NameError: If a related model still cannot be found
+        ValueError: If a relationship fails validation
+    """
+    errors = []
+    for _ in range(len(_pending_resolutions)):
+        entry = _pending_resolutions.popleft()
+        pending = _pending_relation(entry)
+        if pending is None:
+            continue
+        owner, relation = pending
+        try:
+            relation.get_related_model(owner, namespace)
+        except (NameError, ValueError) as e:
+            _pending_resolutions.append(entry)
+            errors.append(e)
+    if errors:
+        raise errors[0]
+
 
 class RelationManagementMixin(RelationManagementInterface):
     """Mixin providing relation management capabilities."""
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Register subclass and resolve its relations.
+
+        Relations whose related model already exists are resolved here, so
+        later access skips resolution entirely. Besides module globals, names
+        are looked up among the classes created before this one in the same
+        scope, which covers models defined inside a function. Queued
+        relations of that scope waiting for this class are resolved too.
+        Anything still unresolved is left to ``finalize()``.
+        """
+        super().__init_subclass__(**kwargs)
+        relations = cls._ensure_relations().maps[0]
+        models = _enter_scope(cls)
+        _resolve_pending_in_scope(_model_scope(cls), models)
+
+        for name, relation in relations.items():
+            try:
+                relation.get_related_model(cls, models)
+            except (NameError, ValueError):
+                _queue_resolution(cls, name)
+
     @classmethod
-    def _ensure_relations(cls) -> dict:
-        """Ensure class has its own relations dictionary."""
-        if '_relations_dict' not in cls.__dict__:  # Check class's own dict
-            cls._relations_dict = {}
-        return cls._relations_dict
+    def _ensure_relations(cls) -> ChainMap:
+        """
+        Ensure class has its own relations mapping.
+
+        The mapping is a ChainMap whose first map holds the relations
+        registered on this class, followed by those of its bases in MRO
+        order. Inherited relations are visible without being copied, and
+        relations registered on the class shadow them.
+        """
+        relations = cls.__dict__.get('_relations_dict')  # Check class's own dict
+        if relations is None:
+            relations = ChainMap({}, *(
+                base.__dict__['_relations_dict'].maps[0]
+                for base in cls.__mro__[1:]
+                if '_relations_dict' in base.__dict__
+            ))
+            cls._relations_dict = relations
+        return relations
 
     @classmethod
     def register_relation(cls, name: str, relation: RelationDescriptor) -> None:
@@ -28,17 +178,67 @@ class RelationManagementMixin(RelationManagementInterface):
         #     raise ValueError(f"Duplicate relation: {name}")
         relations[name] = relation
 
+        # Subclasses see this relation too, so their cached names are stale
+        stale = [cls]
+        while stale:
+            klass = stale.pop()
+            klass._relations_names = None
+            stale.extend(klass.__subclasses__())
+
+    @classmethod
+    def _get_relations_view(cls) -> Mapping[str, RelationDescriptor]:
+        """
+        Get a read-only view of all relations, including inherited ones.
+
+        The view wraps the relations ChainMap itself, so inherited relations
+        are not copied and relations registered later show up without
+        rebuilding it. It is created once per class.
+        """
+        view = cls.__dict__.get('_relations_view')
+        if view is None:
+            view = MappingProxyType(cls._ensure_relations())
+            cls._relations_view = view
+        return view
+
     @classmethod
     def get_relation(cls, name: str) -> Optional[RelationDescriptor]:
         """Get relation by name."""
-        relations = cls._ensure_relations()
-        return relations.get(name)
+        view = cls.__dict__.get('_relations_view')
+        if view is None:
+            view = cls._get_relations_view()
+        return view.get(name)
 
     @classmethod
-    def get_relations(cls) -> List[str]:
+    def get_relations(cls) -> Tuple[str, ...]:
         """Get all relation names."""
-        relations = cls._ensure_relations()
-        return list(relations.keys())
+        names = cls.__dict__.get('_relations_names')
+        if names is None:
+            names = tuple(cls._get_relations_view())
+            cls._relations_names = names
+        return names
+
+    @classmethod
+    def prefetch(cls, instances: Sequence[Any], *names: str) -> None:
+        """
+        Load relations for many instances up front.
+
+        Each relation is loaded with a single ``load_many`` call on its
+        loader and the results are cached, so subsequent access is a cache
+        hit instead of one loader call per instance.
+
+        Args:
+            instances: Instances of this model
+            *names: Relations to prefetch, all if omitted
+
+        Raises:
+            ValueError: If relation doesn't exist
+        """
+        relations = cls._get_relations_view()
+        for name in names or relations:
+            relation = relations.get(name)
+            if relation is None:
+                raise ValueError(f"Unknown relation: {name}")
+            relation.prefetch(instances)
 
     def clear_relation_cache(self, name: Optional[str] = None) -> None:
         """
@@ -50,9 +250,9 @@ class RelationManagementMixin(RelationManagementInterface):
         Raises:
             ValueError: If relation doesn't exist
         """
-        relations = self._ensure_relations()
+        relations = self._get_relations_view()
         if name:
-            relation = self.get_relation(name)
+            relation = relations.get(name)
             if relation is None:
                 raise ValueError(f"Unknown relation: {name}")
             relation.__delete__(self)
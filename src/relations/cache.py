@@ -3,10 +3,20 @@ Caching implementation for relation data.
 Provides configurable caching with TTL and size limits.
 """
 
+import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from threading import Lock
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Optional, Dict, Tuple
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Clock used for TTL deadlines, in integer nanoseconds; tests replace it
+_now = time.monotonic_ns
+
+# Marks a cache miss, so cached None values are hits too
+_MISS = object()
 
 @dataclass
 class CacheConfig:
@@ -15,7 +25,8 @@ class CacheConfig:
     Attributes:
         enabled: Whether caching is enabled
         ttl: Time-to-live in seconds
-        max_size: Maximum number of entries
+        max_size: Maximum number of entries; least recently used
+            entries are evicted beyond this
     """
     enabled: bool = True
     ttl: Optional[int] = 300
@@ -44,65 +55,123 @@ class GlobalCacheConfig:
 class CacheEntry:
     """Single cache entry with expiration tracking.
 
+    Expiration uses a monotonic deadline in integer nanoseconds, so it is
+    unaffected by wall-clock adjustments.
+
     Args:
         value: Cached value
         ttl: Time-to-live in seconds
     """
+    __slots__ = ('value', '_deadline')
+
     def __init__(self, value: Any, ttl: Optional[int] = None):
         self.value = value
-        self.created_at = datetime.now()
-        self.ttl = ttl
+        self._deadline = _now() + int(ttl * _NS_PER_SECOND) if ttl is not None else None
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
-        if self.ttl is None:
-            return False
-        return datetime.now() > self.created_at + timedelta(seconds=self.ttl)
+        return self._deadline is not None and _now() > self._deadline
 
 class RelationCache:
     """Thread-safe cache manager for relation data.
 
+    Entries are stored as ``(deadline_ns, value, ref)`` tuples rather than
+    CacheEntry objects to keep the read path free of attribute lookups.
+    When ``max_size`` is reached the least recently used entry is evicted.
+
+    Each cache belongs to a single relation, so entries are keyed by
+    ``id(instance)`` alone. ``ref`` is a weak reference to the instance,
+    checked on every hit so an entry left behind by a collected instance
+    is never returned to a new object that reuses its id. Instances that
+    do not support weak references are matched by id alone.
+
     Args:
         config: Cache configuration, uses global if None
     """
+    __slots__ = ('_cache', '_lock', 'config', 'relation_name')
+
     def __init__(self, config: Optional[CacheConfig] = None):
         self.relation_name = None
-        self._cache: Dict[tuple, CacheEntry] = {}
+        self._cache: Dict[int, Tuple[Optional[int], Any, Optional[weakref.ref]]] = OrderedDict()
         self._lock = Lock()
         self.config = config or GlobalCacheConfig().config
 
-    def get(self, instance: Any) -> Optional[Any]:
-        """Get cached value for instance."""
-        if not self.config.enabled:
-            return None
+    def get(self, instance: Any, default: Any = None) -> Optional[Any]:
+        """Get cached value for instance, or ``default`` if there is none.
 
-        with self._lock:
-            key = (id(instance), self.relation_name)
-            entry = self._cache.get(key)
+        Pass a sentinel as ``default`` to tell a cached None apart from
+        a miss.
 
-            if entry is None or entry.is_expired():
-                if entry:
+        Reads do not take the lock: dict lookups are atomic, so a reader
+        may briefly observe an entry that is being replaced, but never a
+        partially written one. The lock is only taken to evict an expired
+        or stale entry.
+        """
+        if not self.config.enabled:
+            return default
+
+        key = id(instance)
+        entry = self._cache.get(key)
+        if entry is None:
+            return default
+
+        deadline, value, ref = entry
+        if (ref is not None and ref() is not instance) or (
+                deadline is not None and _now() > deadline):
+            with self._lock:
+                # Only evict if no fresh value was stored in the meantime
+                if self._cache.get(key) is entry:
                     del self._cache[key]
-                return None
+            return default
 
-            return entry.value
+        try:
+            self._cache.move_to_end(key)
+        except KeyError:
+            # Evicted or deleted by another thread since the lookup
+            pass
+        return value
 
     def set(self, instance: Any, value: Any) -> None:
         """Cache value for instance."""
         if not self.config.enabled:
             return
 
-        with self._lock:
-            if self.config.max_size and len(self._cache) >= self.config.max_size:
-                self._cache.clear()
+        try:
+            ref = weakref.ref(instance)
+        except TypeError:
+            ref = None
 
-            key = (id(instance), self.relation_name)
-            self._cache[key] = CacheEntry(value, self.config.ttl)
+        with self._lock:
+            ttl = self.config.ttl
+            key = id(instance)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif self.config.max_size and len(self._cache) >= self.config.max_size:
+                self._cache.popitem(last=False)
+
+            deadline = _now() + int(ttl * _NS_PER_SECOND) if ttl is not None else None
+            self._cache[key] = (deadline, value, ref)
+
+    def get_or_load(self, instance: Any, load: Callable[[Any], Any]) -> Any:
+        """Get cached value for instance, loading and caching it on a miss.
+
+        The loader runs outside the lock, so a slow or re-entrant loader
+        never blocks other readers; concurrent misses may each call it.
+
+        Args:
+            instance: Instance to look up
+            load: Called with the instance to produce the value on a miss
+        """
+        value = self.get(instance, _MISS)
+        if value is _MISS:
+            value = load(instance)
+            self.set(instance, value)
+        return value
 
     def delete(self, instance: Any) -> None:
         """Remove cached value for instance."""
         with self._lock:
-            key = (id(instance), self.relation_name)
+            key = id(instance)
             self._cache.pop(key, None)
 
     def clear(self) -> None:
@@ -3,60 +3,96 @@ Concrete relation descriptor implementations.
 Provides BelongsTo, HasOne, and HasMany relationship types.
 """
 
-from typing import Type, Any, Generic, TypeVar, Union, ForwardRef, Optional, get_type_hints, ClassVar
+import logging
+import sys
+from collections import ChainMap
+from functools import partial
+from typing import Type, Any, Generic, TypeVar, Union, ForwardRef, Optional, ClassVar, get_args, get_origin, Mapping, Sequence
 
-from .cache import RelationCache, CacheConfig
+from .cache import RelationCache, CacheConfig, _MISS
 from .interfaces import RelationValidation, RelationManagementInterface, RelationLoader
 
 
 T = TypeVar('T')
 
-def _evaluate_forward_ref(ref: Union[str, ForwardRef], owner: Type[Any]) -> Type[T]:
+logger = logging.getLogger(__name__)
+
+# Loader errors that are logged and turn into a None result; anything
+# else, including programming errors, propagates to the caller.
+LOAD_ERRORS = (LookupError, ValueError, RuntimeError)
+
+def _evaluate_forward_ref(ref: Union[str, ForwardRef], owner: Type[Any],
+                          namespace: Optional[Mapping[str, Any]] = None) -> Type[T]:
     """
     Evaluate forward reference in proper context.
 
+    Names are looked up in the owner itself, then in ``namespace`` if
+    given, then in the owner's module globals.
+
     Args:
         ref: String or ForwardRef to evaluate
         owner: Owner model class for resolution context
+        namespace: Extra names to resolve against
 
     Returns:
         Resolved model class
+
+    Raises:
+        NameError: If the reference cannot be resolved
     """
-    import sys
-    import inspect
-
-    # Get calling frame to access local scope
-    frame = inspect.currentframe()
-    while frame:
-        if owner.__module__ in str(frame.f_code):
-            local_context = frame.f_locals
-            break
-        frame = frame.f_back
-    else:
-        local_context = {}
-
-    module = sys.modules[owner.__module__]
-    module_globals = {k: getattr(module, k) for k in dir(module)}
-    owner_locals = {owner.__name__: owner}
-
-    # Combine all contexts with priority to most specific scope
-    context = {}
-    context.update(module_globals)
-    context.update(local_context)
-    context.update(owner_locals)
-
-    type_str = ref if isinstance(ref, str) else ref.__forward_arg__
-
-    if isinstance(ref, ForwardRef):
-        try:
-            return ref._evaluate(context, None, recursive_guard=set())
-        except TypeError:
-            try:
-                return ref._evaluate(context, None, set())
-            except TypeError:
-                pass
+    local_context = {owner.__name__: owner}
+    if namespace:
+        local_context = ChainMap(local_context, namespace)
+
+    # ForwardRef carries precompiled code for its argument
+    code = ref.__forward_code__ if isinstance(ref, ForwardRef) else ref
+    try:
+        return eval(code, sys.modules[owner.__module__].__dict__, local_context)
+    except NameError as e:
+        name = ref.__forward_arg__ if isinstance(ref, ForwardRef) else ref
+        raise NameError(
+            f"Cannot resolve forward reference {name!r} for {owner.__qualname__}: {e}"
+        ) from e
+
+class _BoundRelation:
+    """
+    Relation accessor bound to a model instance.
+
+    Calling it without arguments loads the relation; any arguments are
+    forwarded to the descriptor's query implementation.
+
+    Args:
+        descriptor: The RelationDescriptor being accessed
+        instance: Model instance the relation belongs to
+    """
+
+    __slots__ = ('_descriptor', '_instance')
+
+    def __init__(self, descriptor: 'RelationDescriptor', instance: Any):
+        self._descriptor = descriptor
+        self._instance = instance
 
-    return eval(type_str, context, None)
+    def __call__(self, *args, **kwargs):
+        descriptor = self._descriptor
+        if args or kwargs:
+            query = descriptor._query
+            return query.query(self._instance, *args, **kwargs) if query else None
+        return descriptor._load_relation(self._instance)
+
+    def clear_cache(self) -> None:
+        """Clear cached relation data for the bound instance."""
+        self._descriptor._cache.delete(self._instance)
+
+def _query_classmethod(descriptor: 'RelationDescriptor', cls: Type[Any]) -> Any:
+    """
+    Return QuerySet for the related model of a relation.
+
+    Bound per relation with functools.partial and installed on the owner
+    as the ``{name}_query`` class method.
+    """
+    # Force model resolution if needed
+    related_model = descriptor.get_related_model(cls)
+    return related_model.objects()
 
 class RelationDescriptor(Generic[T]):
     """
@@ -69,25 +105,37 @@ class RelationDescriptor(Generic[T]):
         query: Custom query implementation
         validator: Custom validation implementation
         cache_config: Cache configuration
+        trusted: Build related models from loader row dicts with
+            ``model_construct``, skipping validation. Only use this
+            for data that is already known to be valid.
 
     Raises:
         ValueError: If inverse relationship validation fails
     """
 
+    __slots__ = (
+        'foreign_key', 'inverse_of', '_loader', '_query', '_validator',
+        '_cache', '_cached_model', 'name', '_resolved', 'trusted',
+    )
+
     def __init__(
             self,
             foreign_key: str,
             inverse_of: Optional[str] = None,
             loader: Optional[RelationLoader[T]] = None,
             validator: Optional[RelationValidation] = None,
-            cache_config: Optional[CacheConfig] = None
+            cache_config: Optional[CacheConfig] = None,
+            trusted: bool = False
     ):
         self.foreign_key = foreign_key
         self.inverse_of = inverse_of
         self._loader = loader
+        self._query = None
         self._validator = validator
         self._cache = RelationCache(cache_config)
         self._cached_model: Optional[Type[T]] = None
+        self._resolved = False
+        self.trusted = trusted
 
     def __set_name__(self, owner: Type[RelationManagementInterface], name: str) -> None:
         """Set descriptor name and register with owner."""
@@ -97,8 +145,7 @@ class RelationDescriptor(Generic[T]):
         owner.register_relation(name, self)
 
         # Create query method that returns QuerySet for the related model
-        query_method = self._create_query_method()
-        setattr(owner, f"{name}_query", query_method)
+        setattr(owner, f"{name}_query", classmethod(partial(_query_classmethod, self)))
 
     def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
         """Get descriptor or create bound method."""
@@ -106,76 +153,83 @@ class RelationDescriptor(Generic[T]):
         if instance is None:
             return self
 
-        # Force validation on first access
-        if self._cached_model is None:
-            # print("DEBUG: Forcing model resolution")
-            # self.get_related_model(owner or type(instance))
-            ...
-
-        return self._create_relation_method(instance)
+        return _BoundRelation(self, instance)
 
     def __delete__(self, instance: Any) -> None:
         """Clear cache on deletion."""
         self._cache.delete(instance)
 
-    def get_related_model(self, owner: Type[Any]) -> Type[T]:
+    def get_related_model(self, owner: Type[Any],
+                          namespace: Optional[Mapping[str, Any]] = None) -> Type[T]:
         """
         Get related model class, resolving if needed.
 
         Args:
             owner: Owner model class
+            namespace: Extra names to resolve forward references against,
+                besides the owner and its module globals
 
         Returns:
             Type[T]: Related model class
 
         Raises:
-            ValueError: If model cannot be resolved
+            ValueError: If model cannot be resolved or validation fails
+            NameError: If a forward reference cannot be resolved yet
         """
-        if self._cached_model is None:
-            self._cached_model = self._resolve_model(owner)
+        if self._resolved:
+            return self._cached_model
+
+        # A model found by an earlier call that failed validation is kept,
+        # so only the validation is retried
+        model = self._cached_model
+        if model is None:
+            model = self._resolve_model(owner, namespace)
 
             # Ensure model is fully resolved before validation
-            if isinstance(self._cached_model, (str, ForwardRef)):
-                self._cached_model = _evaluate_forward_ref(self._cached_model, owner)
+            if isinstance(model, (str, ForwardRef)):
+                model = _evaluate_forward_ref(model, owner, namespace)
+            self._cached_model = model
 
-            if self.inverse_of and self._validator:
-                try:
-                    self._validate_inverse_relationship(owner)
-                except Exception as e:
-                    self._cached_model = None
-                    raise ValueError(f"Invalid relationship: {str(e)}")
+        if self.inverse_of and self._validator:
+            try:
+                self._validate_inverse_relationship(owner)
+            except Exception as e:
+                raise ValueError(f"Invalid relationship: {str(e)}")
 
-        return self._cached_model
+        self._resolved = True
+        return model
 
-    def _resolve_model(self, owner: Type[Any]) -> Union[Type[T], ForwardRef, str]:
+    def _resolve_model(self, owner: Type[Any],
+                       namespace: Optional[Mapping[str, Any]] = None) -> Union[Type[T], ForwardRef, str]:
         """
-        Resolve model type from annotations, handling both string and ForwardRef.
+        Resolve model type from this descriptor's own annotation.
 
-        Python 3.8+ compatible implementation that properly handles forward references.
+        Only the single annotation named after the descriptor is evaluated,
+        in the context of the class that declares it, so the remaining
+        annotations on the model are never touched. String annotations,
+        e.g. under ``from __future__ import annotations``, are evaluated
+        the same way as forward references.
         """
-        # Get module globals for model resolution context
-        import sys
-        module = sys.modules[owner.__module__]
-        module_globals = {k: getattr(module, k) for k in dir(module)}
-
-        # First attempt with get_type_hints
-        try:
-            type_hints = get_type_hints(owner, localns=module_globals)
-        except (NameError, AttributeError):
-            # Fallback to raw annotations for forward refs
-            type_hints = owner.__annotations__
-
-        # Find descriptor field in type hints
-        for name, field_type in type_hints.items():
-            if getattr(owner, name, None) is self:
-                # Handle ClassVar wrapper
-                if hasattr(field_type, "__origin__") and field_type.__origin__ is ClassVar:
-                    field_type = field_type.__args__[0]
-
-                # Get model type from generic parameters
-                if hasattr(field_type, "__origin__") and hasattr(field_type, "__args__"):
-                    model_type = field_type.__args__[0]
-                    return model_type
+        # Inherited descriptors are annotated on the declaring class
+        declaring = next(
+            (klass for klass in owner.__mro__ if klass.__dict__.get(self.name) is self),
+            owner
+        )
+        field_type = getattr(declaring, '__annotations__', {}).get(self.name)
+        if isinstance(field_type, str):
+            field_type = _evaluate_forward_ref(field_type, declaring, namespace)
+
+        # Handle ClassVar wrapper
+        if get_origin(field_type) is ClassVar:
+            field_type = get_args(field_type)[0]
+
+        # Get model type from generic parameters
+        args = get_args(field_type)
+        if get_origin(field_type) is not None and args:
+            model_type = args[0]
+            if isinstance(model_type, (str, ForwardRef)):
+                model_type = _evaluate_forward_ref(model_type, declaring, namespace)
+            return model_type
 
         raise ValueError("Unable to resolve relationship model")
 
@@ -190,49 +244,90 @@ class RelationDescriptor(Generic[T]):
             self._validator.validate(owner, self._cached_model)
         # Default validation logic here
 
-    def _create_relation_method(self, instance: Any):
-        """Create bound method for accessing relation."""
-
-        def relation_method(*args, **kwargs):
-            if args or kwargs:
-                return self._query.query(instance, *args, **kwargs) if self._query else None
-            return self._load_relation(instance)
-
-        relation_method.clear_cache = lambda: self._cache.delete(instance)
-        return relation_method
-
-    def _create_query_method(self):
-        """Create query class method."""
-
-        def query_method(instance):
-            # Force model resolution if needed
-            related_model = self.get_related_model(type(instance))
-            # Return QuerySet instance for the related model
-            return related_model.objects()
-        return query_method
-
     def _load_relation(self, instance: Any) -> Optional[T]:
         """
         Load relation with caching support.
 
+        Errors listed in ``LOAD_ERRORS`` raised by the loader are logged
+        and None is returned; other exceptions propagate.
+
         Returns:
             Optional[T]: Related data or None
         """
-        if self._cached_model is None:
+        if not self._resolved:
             self.get_related_model(type(instance))
-
-        cached = self._cache.get(instance)
-        if cached is not None:
-            return cached
+        if self._loader is None:
+            return None
 
         try:
-            data = self._loader.load(instance) if self._loader else None
-            self._cache.set(instance, data)
-            return data
-        except Exception as e:
-            print(f"Error loading relation: {e}")
+            return self._cache.get_or_load(instance, self._fetch)
+        except LOAD_ERRORS:
+            logger.exception("Error loading relation %r", self.name)
             return None
 
+    def _fetch(self, instance: Any) -> Optional[T]:
+        """Load relation data for instance from the loader, bypassing the cache."""
+        data = self._loader.load(instance)
+        return self._construct(data) if self.trusted else data
+
+    def prefetch(self, instances: Sequence[Any]) -> None:
+        """
+        Load relation for many instances with one ``load_many`` call.
+
+        Results are stored in the relation cache, so later access through
+        the relation is a cache hit. Instances that already have cached
+        data are skipped. Nothing is loaded when caching is disabled, since
+        the results could not be kept.
+
+        Args:
+            instances: Model instances owning this relation
+
+        Raises:
+            ValueError: If ``load_many`` returns a different number of
+                results than instances it was given
+        """
+        if self._loader is None or not instances or not self._cache.config.enabled:
+            return
+        if not self._resolved:
+            self.get_related_model(type(instances[0]))
+
+        pending = list({
+            id(instance): instance
+            for instance in instances
+            if self._cache.get(instance, _MISS) is _MISS
+        }.values())
+        if not pending:
+            return
+
+        results = self._loader.load_many(pending)
+        if len(results) != len(pending):
+            raise ValueError(
+                f"{type(self._loader).__name__}.load_many returned {len(results)} "
+                f"results for {len(pending)} instances of relation '{self.name}'"
+            )
+        for instance, data in zip(pending, results):
+            if self.trusted:
+                data = self._construct(data)
+            self._cache.set(instance, data)
+
+    def _construct(self, data: Any) -> Any:
+        """
+        Build related model instances from trusted row dicts.
+
+        Uses ``model_construct`` so no validators run. Values that are not
+        dicts, such as already built models, are returned unchanged.
+        """
+        construct = self._cached_model.model_construct
+        if isinstance(data, dict):
+            return construct(**data)
+        if isinstance(data, list):
+            return [construct(**row) if isinstance(row, dict) else row for row in data]
+        return data
+
+def _model_name(model: Any) -> str:
+    """Return model name for error messages."""
+    return getattr(model, '__name__', None) or str(model)
+
 class RelationshipValidator(RelationValidation):
     """Default relationship validator implementation."""
 
@@ -257,64 +352,79 @@ class RelationshipValidator(RelationValidation):
         Raises:
             ValueError: If validation fails
         """
-        # Ensure both models have __name__ attribute
-        owner_name = getattr(owner, '__name__', str(owner))
-        related_name = getattr(related_model, '__name__', str(related_model))
+        # Relation-managed models index their relations by name; plain
+        # classes fall back to an attribute lookup
+        get_relation = getattr(related_model, 'get_relation', None)
+        inverse_rel = get_relation(self.descriptor.inverse_of) if get_relation is not None else None
+        if inverse_rel is None:
+            inverse_rel = getattr(related_model, self.descriptor.inverse_of, _MISS)
+            if inverse_rel is _MISS:
+                raise ValueError(f"Inverse relationship '{self.descriptor.inverse_of}' not found in {_model_name(related_model)}")
 
-        if not hasattr(related_model, self.descriptor.inverse_of):
-            raise ValueError(f"Inverse relationship '{self.descriptor.inverse_of}' not found in {related_name}")
-
-        inverse_rel = getattr(related_model, self.descriptor.inverse_of)
         if not isinstance(inverse_rel, RelationDescriptor):
             raise ValueError(
                 f"Inverse relationship '{self.descriptor.inverse_of}' in "
-                f"{related_name} must be a RelationDescriptor"
+                f"{_model_name(related_model)} must be a RelationDescriptor"
             )
 
-        # Check for valid relationship pairs
-        valid_pairs = [
-            (BelongsTo, HasOne),
-            (BelongsTo, HasMany),
-            (HasOne, BelongsTo),
-            (HasMany, BelongsTo),
-        ]
-
-        if not any(isinstance(self.descriptor, t1) and isinstance(inverse_rel, t2)
-                  for t1, t2 in valid_pairs):
+        # Check for valid relationship pairs: exact types hit the set
+        # directly, subclasses of the relation types fall back to isinstance
+        if (type(self.descriptor), type(inverse_rel)) not in _VALID_PAIRS and not any(
+                isinstance(self.descriptor, t1) and isinstance(inverse_rel, t2)
+                for t1, t2 in _VALID_PAIRS):
             raise ValueError(
-                f"Invalid relationship pair between {owner_name} and {related_name}: "
+                f"Invalid relationship pair between {_model_name(owner)} and {_model_name(related_model)}: "
                 f"{type(self.descriptor).__name__} and {type(inverse_rel).__name__}"
             )
 
         # Set inverse relationship name if not already set
         if inverse_rel.inverse_of is None:
-            for name, value in owner.__dict__.items():
-                if value is self.descriptor:
-                    inverse_rel.inverse_of = name
-                    break
-        elif not any(value is self.descriptor for value in owner.__dict__.values()):
-            raise ValueError(f"Inconsistent inverse relationship between {owner_name} and {related_name}")
+            inverse_rel.inverse_of = self.descriptor.name
+        elif getattr(owner, self.descriptor.name, None) is not self.descriptor:
+            raise ValueError(f"Inconsistent inverse relationship between {_model_name(owner)} and {_model_name(related_model)}")
 
 class BelongsTo(RelationDescriptor[T], Generic[T]):
     """
     One-to-one or many-to-one relationship.
     Instance belongs to a single instance of related model.
     """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, validator=RelationshipValidator(self), **kwargs)
+        super().__init__(*args, **kwargs)
+        # Validation only runs for relations that declare an inverse;
+        # an explicitly passed validator is kept
+        if self.inverse_of and self._validator is None:
+            self._validator = RelationshipValidator(self)
 
 class HasOne(RelationDescriptor[T], Generic[T]):
     """
     One-to-one relationship.
     Instance has one related instance.
     """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, validator=RelationshipValidator(self), **kwargs)
+        super().__init__(*args, **kwargs)
+        if self.inverse_of and self._validator is None:
+            self._validator = RelationshipValidator(self)
 
 class HasMany(RelationDescriptor[T], Generic[T]):
     """
     One-to-many relationship.
     Instance has multiple related instances.
     """
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, validator=RelationshipValidator(self), **kwargs)
\ No newline at end of file
+        super().__init__(*args, **kwargs)
+        if self.inverse_of and self._validator is None:
+            self._validator = RelationshipValidator(self)
+
+# Valid (descriptor, inverse) relation type pairs
+_VALID_PAIRS = frozenset({
+    (BelongsTo, HasOne),
+    (BelongsTo, HasMany),
+    (HasOne, BelongsTo),
+    (HasMany, BelongsTo),
+})
@@ -4,7 +4,7 @@ Defines abstract base classes for relationship loading and querying.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar, Generic, Optional, List, ClassVar
+from typing import Any, TypeVar, Generic, Optional, Tuple, ClassVar, List, Sequence
 
 T = TypeVar('T')
 
@@ -30,6 +30,22 @@ class RelationLoader(Generic[T], ABC):
         """
         pass
 
+    def load_many(self, instances: Sequence[Any]) -> List[Optional[T]]:
+        """
+        Load related data for several model instances at once.
+
+        The default implementation calls load() for each instance. Override
+        it to fetch everything in a single query and avoid N+1 loading.
+
+        Args:
+            instances: Source model instances to load relations for
+
+        Returns:
+            List[Optional[T]]: Related data for each instance, in the same
+            order as ``instances``
+        """
+        return [self.load(instance) for instance in instances]
+
 class RelationValidation(ABC):
     """
     Abstract interface for relationship validation.
@@ -66,7 +82,7 @@ class RelationManagementInterface(ABC):
         pass
 
     @abstractmethod
-    def get_relations(self) -> List[str]:
+    def get_relations(self) -> Tuple[str, ...]:
         """Get all relation names."""
         pass
 
@@ -1,15 +1,42 @@
 """Test fixtures for the relations package."""
 
+from collections import deque
 from typing import ClassVar, Any, Optional, List
 import pytest
 from pydantic import BaseModel
 
+from src.relations import base, cache
 from src.relations.base import RelationManagementMixin
 from src.relations.cache import CacheConfig
 from src.relations.descriptors import BelongsTo, HasMany, HasOne
 from src.relations.interfaces import RelationLoader
 
 
+class FakeClock:
+    """Manually advanced replacement for the cache's monotonic clock."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1_000_000_000)
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache, "_now", clock)
+    return clock
+
+@pytest.fixture
+def pending_resolutions(monkeypatch):
+    """Empty finalize() queue, isolated from models defined by other tests."""
+    queue = deque()
+    monkeypatch.setattr(base, "_pending_resolutions", queue)
+    return queue
+
 class Employee(RelationManagementMixin, BaseModel):
     id: int
     name: str
@@ -35,11 +62,11 @@ def employee():
 def department():
     return Department(id=1, name="Engineering")
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def employee_class():
     return Employee
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def department_class():
     return Department
 
@@ -1,9 +1,12 @@
 """Tests for base module."""
+import gc
+import weakref
 from typing import ClassVar
 
+import pytest
 from pydantic import BaseModel
 
-from src.relations.base import RelationManagementMixin
+from src.relations.base import RelationManagementMixin, finalize
 from src.relations.cache import CacheConfig
 from src.relations.descriptors import HasOne, HasMany, BelongsTo, RelationDescriptor
 from src.relations.interfaces import RelationLoader
@@ -45,6 +48,25 @@ def test_relation_descriptor_get_related_model(employee_class, department_class)
     assert inverse_model == employee_class
 
 
+def test_string_annotation_resolution():
+    """Test relations declared with string annotations resolve."""
+
+    class Reader(RelationManagementMixin, BaseModel):
+        id: int
+        card: "ClassVar[HasOne['Card']]" = HasOne(foreign_key="reader_id")
+
+    class Card(RelationManagementMixin, BaseModel):
+        id: int
+        reader_id: int
+
+    class Member(Reader):
+        pass
+
+    relation = Reader.get_relation("card")
+    assert relation.get_related_model(Reader) is Card
+    assert relation._resolve_model(Member, {"Card": Card}) is Card
+
+
 def test_relation_descriptor_load(employee):
     """Test loading relation data."""
     relation = employee.get_relation("department")
@@ -90,6 +112,19 @@ def test_relation_descriptor_cache_clear(employee):
     assert data == {"id": 1, "name": "Test"}
 
 
+def test_bound_relation_clear_cache(employee):
+    """Test loading and clearing cache through the bound relation."""
+    relation = employee.get_relation("department")
+    relation._loader = CustomLoader()
+
+    bound = employee.department
+    assert bound() == {"id": 1, "name": "Test"}
+    assert relation._cache.get(employee) == {"id": 1, "name": "Test"}
+
+    bound.clear_cache()
+    assert relation._cache.get(employee) is None
+
+
 def test_relation_registration_validation():
     """Test validation during relation registration."""
 
@@ -160,4 +195,419 @@ def test_forward_reference_resolution():
 
     # Verify relationships can be accessed
     assert a.b is not None
-    assert b.a is not None
\ No newline at end of file
+    assert b.a is not None
+
+def _define_writer_models():
+    class Writer(RelationManagementMixin, BaseModel):
+        id: int
+        articles: ClassVar[HasMany["Article"]] = HasMany(
+            foreign_key="writer_id",
+            inverse_of="writer"
+        )
+
+    class Article(RelationManagementMixin, BaseModel):
+        id: int
+        writer_id: int
+        writer: ClassVar[BelongsTo["Writer"]] = BelongsTo(
+            foreign_key="writer_id",
+            inverse_of="articles"
+        )
+
+    return Writer, Article
+
+
+def test_forward_reference_resolution_per_scope():
+    """Test forward references resolve within the same call of a factory."""
+    writer, article = _define_writer_models()
+    other_writer, other_article = _define_writer_models()
+    assert article is not other_article
+
+    assert writer.get_relation("articles").get_related_model(writer) is article
+    assert article.get_relation("writer").get_related_model(article) is writer
+    assert other_writer.get_relation("articles").get_related_model(other_writer) is other_article
+    assert other_article.get_relation("writer").get_related_model(other_article) is other_writer
+
+
+def test_relations_resolved_at_class_creation():
+    """Test relations to already defined models resolve eagerly."""
+
+    class EagerA(RelationManagementMixin, BaseModel):
+        id: int
+        b: ClassVar[HasOne["EagerB"]] = HasOne(
+            foreign_key="a_id",
+            inverse_of="a"
+        )
+
+    # EagerB does not exist yet, so resolution is deferred
+    assert not EagerA.get_relation("b")._resolved
+
+    class EagerB(RelationManagementMixin, BaseModel):
+        id: int
+        a_id: int
+        a: ClassVar[BelongsTo["EagerA"]] = BelongsTo(
+            foreign_key="a_id",
+            inverse_of="b"
+        )
+
+    relation = EagerB.get_relation("a")
+    assert relation._resolved
+    assert relation._cached_model is EagerA
+
+    # Creating EagerB also resolved the relation queued for it
+    assert EagerA.get_relation("b")._cached_model is EagerB
+
+
+def test_models_do_not_keep_defining_locals_alive():
+    """Test resolving function-local models holds no reference to the call."""
+
+    class Marker:
+        pass
+
+    def define():
+        marker = Marker()
+
+        class Pen(RelationManagementMixin, BaseModel):
+            id: int
+            cap: ClassVar[HasOne["Cap"]] = HasOne(foreign_key="pen_id")
+
+        class Cap(RelationManagementMixin, BaseModel):
+            id: int
+            pen_id: int
+
+        return Pen, Cap, weakref.ref(marker)
+
+    pen, cap, marker_ref = define()
+    gc.collect()
+    assert marker_ref() is None
+    assert pen.get_relation("cap").get_related_model(pen) is cap
+
+
+def test_get_relations_cache_invalidation():
+    """Test cached relation names are refreshed on registration."""
+
+    class NamedModel(RelationManagementMixin, BaseModel):
+        id: int
+        first: ClassVar[HasOne["Other"]] = HasOne(foreign_key="named_id")
+
+    assert NamedModel.get_relations() == ("first",)
+    assert NamedModel.get_relations() is NamedModel.get_relations()
+
+    NamedModel.register_relation("second", HasMany(foreign_key="named_id"))
+    assert NamedModel.get_relations() == ("first", "second")
+
+
+def test_trusted_relation_constructs_models():
+    """Test trusted relations build models from rows without validation."""
+
+    class RowsLoader(RelationLoader):
+        def load(self, instance):
+            return [{"id": "1", "shelf_id": instance.id}, {"id": 2, "shelf_id": instance.id}]
+
+    class Shelf(RelationManagementMixin, BaseModel):
+        id: int
+        items: ClassVar[HasMany["Item"]] = HasMany(
+            foreign_key="shelf_id",
+            loader=RowsLoader(),
+            trusted=True
+        )
+
+    class Item(RelationManagementMixin, BaseModel):
+        id: int
+        shelf_id: int
+
+    items = Shelf(id=1).items()
+    assert all(isinstance(item, Item) for item in items)
+    # Validation is skipped, so the string id is kept as-is
+    assert items[0].id == "1"
+    assert items[1].shelf_id == 1
+
+
+def test_prefetch_batches_loader_calls():
+    """Test prefetch loads a relation for many instances in one call."""
+
+    class CountingLoader(RelationLoader):
+        def __init__(self):
+            self.batches = []
+
+        def load(self, instance):
+            raise AssertionError("load() should not be called after prefetch")
+
+        def load_many(self, instances):
+            self.batches.append(len(instances))
+            return [{"id": instance.id} for instance in instances]
+
+    loader = CountingLoader()
+
+    class Team(RelationManagementMixin, BaseModel):
+        id: int
+        lead: ClassVar[HasOne["Lead"]] = HasOne(foreign_key="team_id", loader=loader)
+
+    class Lead(RelationManagementMixin, BaseModel):
+        id: int
+
+    teams = [Team(id=i) for i in range(3)]
+    Team.prefetch(teams, "lead")
+    assert loader.batches == [3]
+    assert [team.lead() for team in teams] == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    # Already cached instances are skipped
+    Team.prefetch(teams + [Team(id=3)])
+    assert loader.batches == [3, 1]
+
+    try:
+        Team.prefetch(teams, "missing")
+        assert False, "Should raise ValueError"
+    except ValueError as e:
+        assert "Unknown relation" in str(e)
+
+
+def test_prefetch_rejects_mismatched_results():
+    """Test prefetch raises when load_many returns the wrong number of results."""
+
+    class ShortLoader(RelationLoader):
+        def load(self, instance):
+            return None
+
+        def load_many(self, instances):
+            return [{"id": instance.id} for instance in instances[1:]]
+
+    class Crew(RelationManagementMixin, BaseModel):
+        id: int
+        captain: ClassVar[HasOne["Captain"]] = HasOne(foreign_key="crew_id", loader=ShortLoader())
+
+    class Captain(RelationManagementMixin, BaseModel):
+        id: int
+
+    crews = [Crew(id=i) for i in range(3)]
+    with pytest.raises(ValueError, match="returned 2 results for 3 instances"):
+        Crew.prefetch(crews, "captain")
+    assert Crew.get_relation("captain")._cache.get(crews[1]) is None
+
+
+def test_prefetch_skipped_when_cache_disabled():
+    """Test prefetch does not call load_many when caching is disabled."""
+
+    class CountingLoader(RelationLoader):
+        def __init__(self):
+            self.calls = 0
+
+        def load(self, instance):
+            return None
+
+        def load_many(self, instances):
+            self.calls += 1
+            return [None for _ in instances]
+
+    loader = CountingLoader()
+
+    class Garage(RelationManagementMixin, BaseModel):
+        id: int
+        car: ClassVar[HasOne["Car"]] = HasOne(
+            foreign_key="garage_id", loader=loader, cache_config=CacheConfig(enabled=False)
+        )
+
+    class Car(RelationManagementMixin, BaseModel):
+        id: int
+
+    Garage.prefetch([Garage(id=1), Garage(id=2)], "car")
+    assert loader.calls == 0
+
+
+def test_load_many_defaults_to_load():
+    """Test the default load_many falls back to load for each instance."""
+    assert CustomLoader().load_many([object(), object()]) == [
+        {"id": 1, "name": "Test"},
+        {"id": 1, "name": "Test"},
+    ]
+
+
+def test_load_errors_are_logged(caplog):
+    """Test expected loader errors are logged and other errors propagate."""
+
+    class FailingLoader(RelationLoader):
+        def __init__(self, error):
+            self.error = error
+
+        def load(self, instance):
+            raise self.error
+
+    class Owner(RelationManagementMixin, BaseModel):
+        id: int
+        missing: ClassVar[HasOne["Owned"]] = HasOne(
+            foreign_key="owner_id",
+            loader=FailingLoader(LookupError("no row"))
+        )
+        broken: ClassVar[HasOne["Owned"]] = HasOne(
+            foreign_key="owner_id",
+            loader=FailingLoader(TypeError("bad loader"))
+        )
+
+    class Owned(RelationManagementMixin, BaseModel):
+        id: int
+        owner_id: int
+
+    owner = Owner(id=1)
+    with caplog.at_level("ERROR", logger="src.relations.descriptors"):
+        assert owner.missing() is None
+    assert "Error loading relation 'missing'" in caplog.text
+
+    try:
+        owner.broken()
+        assert False, "Should raise TypeError"
+    except TypeError as e:
+        assert "bad loader" in str(e)
+
+
+def test_unresolved_forward_reference_error():
+    """Test an unknown forward reference raises a descriptive NameError."""
+
+    class Orphan(RelationManagementMixin, BaseModel):
+        id: int
+        parent: ClassVar[BelongsTo["Nowhere"]] = BelongsTo(foreign_key="parent_id")
+
+    try:
+        Orphan.get_relation("parent").get_related_model(Orphan)
+        assert False, "Should raise NameError"
+    except NameError as e:
+        assert "'Nowhere'" in str(e) and "Orphan" in str(e)
+
+
+def test_none_result_is_cached():
+    """Test a loader returning None is not called again on the next access."""
+
+    class NoneLoader(RelationLoader):
+        def __init__(self):
+            self.calls = 0
+
+        def load(self, instance):
+            self.calls += 1
+            return None
+
+    loader = NoneLoader()
+
+    class Desk(RelationManagementMixin, BaseModel):
+        id: int
+        lamp: ClassVar[HasOne["Lamp"]] = HasOne(foreign_key="desk_id", loader=loader)
+
+    class Lamp(RelationManagementMixin, BaseModel):
+        id: int
+        desk_id: int
+
+    desk = Desk(id=1)
+    assert desk.lamp() is None
+    assert desk.lamp() is None
+    assert loader.calls == 1
+
+
+def test_relation_without_loader_skips_cache(employee):
+    """Test a relation without a loader returns None without caching."""
+    relation = employee.get_relation("department")
+    relation._loader = None
+
+    assert employee.department() is None
+    assert relation._cache.get(employee, "miss") == "miss"
+
+
+def test_finalize_resolves_pending_relations(pending_resolutions):
+    """Test finalize attempts every queued relation, even after a failure."""
+
+    class Shed(RelationManagementMixin, BaseModel):
+        id: int
+        # Queued first and never resolvable
+        weeds: ClassVar[HasMany["Weed"]] = HasMany(foreign_key="shed_id")
+        tools: ClassVar[HasMany["Tool"]] = HasMany(foreign_key="shed_id")
+
+    def define_tool():
+        # Defined in another scope, so creating it does not resolve Shed
+        class Tool(RelationManagementMixin, BaseModel):
+            id: int
+            shed_id: int
+
+        return Tool
+
+    Tool = define_tool()
+    assert len(pending_resolutions) == 2
+
+    for _ in range(2):
+        with pytest.raises(NameError, match="'Weed'"):
+            finalize({"Tool": Tool})
+        assert Shed.get_relation("tools")._cached_model is Tool
+        assert len(pending_resolutions) == 1
+
+
+def test_finalize_reports_invalid_relationship(pending_resolutions):
+    """Test relationships failing validation at class creation are reported."""
+
+    class Kennel(RelationManagementMixin, BaseModel):
+        id: int
+
+    class Dog(RelationManagementMixin, BaseModel):
+        id: int
+        kennel_id: int
+        kennel: ClassVar[BelongsTo["Kennel"]] = BelongsTo(
+            foreign_key="kennel_id",
+            inverse_of="dogs"
+        )
+
+    with pytest.raises(ValueError, match="Inverse relationship 'dogs' not found"):
+        finalize()
+
+
+def test_pending_resolutions_do_not_keep_models_alive(pending_resolutions):
+    """Test queued relations hold neither their owner nor their loader."""
+
+    def define():
+        class Hive(RelationManagementMixin, BaseModel):
+            id: int
+            bees: ClassVar[HasMany["Bee"]] = HasMany(
+                foreign_key="hive_id",
+                loader=CustomLoader()
+            )
+
+        return weakref.ref(Hive), weakref.ref(Hive.get_relation("bees")._loader)
+
+    owner_ref, loader_ref = define()
+    gc.collect()
+    assert owner_ref() is None and loader_ref() is None
+
+    # The dead entry is skipped and dropped
+    finalize()
+    assert not pending_resolutions
+
+
+def test_inherited_relations_visible():
+    """Test subclasses see relations declared on their bases."""
+
+    class BaseShop(RelationManagementMixin, BaseModel):
+        id: int
+        owner: ClassVar[BelongsTo["Other"]] = BelongsTo(foreign_key="owner_id")
+        items: ClassVar[HasMany["Other"]] = HasMany(foreign_key="shop_id")
+
+    class Bakery(BaseShop):
+        items: ClassVar[HasOne["Other"]] = HasOne(foreign_key="shop_id")
+
+    assert Bakery.get_relation("owner") is BaseShop.get_relation("owner")
+    assert isinstance(Bakery.get_relation("items"), HasOne)
+    assert isinstance(BaseShop.get_relation("items"), HasMany)
+    assert set(Bakery.get_relations()) == {"owner", "items"}
+
+    # Relations added to a base later show up in subclasses, including in
+    # a view taken before the registration
+    Bakery.get_relations()
+    view = Bakery._get_relations_view()
+    BaseShop.register_relation("staff", HasMany(foreign_key="shop_id"))
+    assert "staff" in Bakery.get_relations()
+    assert view["staff"] is BaseShop.get_relation("staff")
+
+
+def test_relations_view_cached_per_class(employee_class):
+    """Test relation lookups share one cached read-only view per class."""
+    view = employee_class._get_relations_view()
+    assert view is employee_class._get_relations_view()
+    assert view["department"] is employee_class.get_relation("department")
+
+    try:
+        view["other"] = None
+        assert False, "Should raise TypeError"
+    except TypeError:
+        pass
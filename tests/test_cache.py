@@ -1,7 +1,5 @@
 """Tests for cache module."""
 
-import time
-
 from src.relations.cache import (
     CacheConfig,
     GlobalCacheConfig,
@@ -34,21 +32,21 @@ def test_global_cache_config():
     assert config2.config.enabled is False
     assert config2.config.ttl == 60
 
-def test_cache_entry():
+def test_cache_entry(fake_clock):
     """Test CacheEntry creation and expiration."""
     entry = CacheEntry("test", ttl=1)
     assert entry.value == "test"
     assert not entry.is_expired()
 
     # Test expiration
-    time.sleep(1.1)
+    fake_clock.advance(1.1)
     assert entry.is_expired()
 
     # Test no TTL
     entry = CacheEntry("test", ttl=None)
     assert not entry.is_expired()
 
-def test_relation_cache():
+def test_relation_cache(fake_clock):
     """Test RelationCache operations."""
     cache = RelationCache(CacheConfig(ttl=1))
     cache.relation_name = "test_relation"
@@ -59,7 +57,7 @@ def test_relation_cache():
     assert cache.get(instance) == "test_value"
 
     # Test expiration
-    time.sleep(1.1)
+    fake_clock.advance(1.1)
     assert cache.get(instance) is None
 
     # Test delete
@@ -82,15 +80,17 @@ def test_relation_cache_max_size():
     instance2 = object()
     instance3 = object()
 
-    cache.set(instance1, "value1")
     cache.set(instance2, "value2")
-    assert cache.get(instance1) == "value1"
+    cache.set(instance1, "value1")
+
+    # Reading an entry marks it as recently used, so instance1 is now the
+    # least recently used one
     assert cache.get(instance2) == "value2"
 
-    # Add one more entry, should clear cache
+    # Add one more entry, should evict the least recently used one
     cache.set(instance3, "value3")
     assert cache.get(instance1) is None
-    assert cache.get(instance2) is None
+    assert cache.get(instance2) == "value2"
     assert cache.get(instance3) == "value3"
 
 def test_relation_cache_disabled():
@@ -138,4 +138,49 @@ def test_cache_memory_management():
         cache.set(instance, f"value_{i}")
 
     # Verify cache size is maintained
-    assert len(cache._cache) <= 5
\ No newline at end of file
+    assert len(cache._cache) <= 5
+
+def test_relation_cache_ignores_reused_ids():
+    """Test entries are not returned to a different object with the same id."""
+
+    class Instance:
+        pass
+
+    cache = RelationCache(CacheConfig())
+    cache.relation_name = "test"
+
+    original = Instance()
+    other = Instance()
+    cache.set(original, "value")
+    assert cache.get(original) == "value"
+
+    # Simulate ``other`` reusing the id of a collected ``original``
+    cache._cache[id(other)] = cache._cache.pop(id(original))
+    assert cache.get(other) is None
+    assert id(other) not in cache._cache
+
+
+def test_relation_cache_get_default():
+    """Test a cached None is distinguishable from a miss via default."""
+    cache = RelationCache(CacheConfig(ttl=None))
+    missing = object()
+    instance = object()
+
+    assert cache.get(instance, missing) is missing
+    cache.set(instance, None)
+    assert cache.get(instance, missing) is None
+
+
+def test_relation_cache_get_or_load():
+    """Test get_or_load calls the loader only on a miss."""
+    cache = RelationCache(CacheConfig(ttl=None))
+    instance = object()
+    calls = []
+
+    def load(obj):
+        calls.append(obj)
+        return "loaded"
+
+    assert cache.get_or_load(instance, load) == "loaded"
+    assert cache.get_or_load(instance, load) == "loaded"
+    assert calls == [instance]
@@ -1,5 +1,6 @@
 """Tests for descriptors module."""
 
+import weakref
 from typing import ClassVar, Any, List, Optional
 
 import pytest
@@ -7,22 +8,51 @@ from pydantic import BaseModel
 
 from src.relations.descriptors import BelongsTo, HasOne, HasMany
 from src.relations.base import RelationManagementMixin
-from src.relations.interfaces import  RelationLoader
+from src.relations.interfaces import  RelationLoader, RelationValidation
+
+
+# Plain records returned by the fake loaders and query set
+class FakeBook:
+    __slots__ = ('id', 'title', 'author_id')
+
+    def __init__(self, id, title, author_id):
+        self.id = id
+        self.title = title
+        self.author_id = author_id
+
+
+class FakeAuthor:
+    __slots__ = ('id', 'name')
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
 
 
 # Mock QuerySet for testing
 class MockQuerySet:
+    # One query set per model class, reused by every objects() call
+    _instances = weakref.WeakKeyDictionary()
+
     def __init__(self, model_class):
         self.model_class = model_class
+        self._results = (FakeBook(1, 'Test Book', 1),)
+
+    @classmethod
+    def for_model(cls, model_class):
+        query_set = cls._instances.get(model_class)
+        if query_set is None:
+            query_set = cls._instances[model_class] = cls(model_class)
+        return query_set
 
     def filter(self, **kwargs):
-        return [type(self.model_class.__name__, (), {'id': 1, 'title': 'Test Book', 'author_id': 1})()]
+        return list(self._results)
 
     def all(self):
-        return self.filter()
+        return list(self._results)
 
     def get(self, **kwargs):
-        return self.filter()[0]
+        return self._results[0]
 
 
 def test_relationship_validator():
@@ -30,11 +60,11 @@ def test_relationship_validator():
 
     class FakeBookLoader(RelationLoader):
         def load(self, instance: Any) -> Optional[Any]:
-            return type('Book', (), {'id': 1, 'title': 'Test Book', 'author_id': instance.id})()
+            return FakeBook(1, 'Test Book', instance.id)
 
     class FakeAuthorLoader(RelationLoader):
         def load(self, instance: Any) -> Optional[Any]:
-            return type('Author', (), {'id': instance.author_id, 'name': 'Test Author'})()
+            return FakeAuthor(instance.author_id, 'Test Author')
 
     class Author(RelationManagementMixin, BaseModel):
         id: int
@@ -47,7 +77,7 @@ def test_relationship_validator():
 
         @classmethod
         def objects(cls):
-            return MockQuerySet(cls)
+            return MockQuerySet.for_model(cls)
 
     class Book(RelationManagementMixin, BaseModel):
         id: int
@@ -61,7 +91,7 @@ def test_relationship_validator():
 
         @classmethod
         def objects(cls):
-            return MockQuerySet(cls)
+            return MockQuerySet.for_model(cls)
 
     # If no exception is raised, validation passed
     author = Author(id=1, name="Test Author")
@@ -82,6 +112,9 @@ def test_relationship_validator():
     queried_books = books_query.filter()
     assert len(queried_books) > 0
 
+    # Query method is also available on the class
+    assert Author.book_query() is books_query
+
 
 def test_invalid_relationship_types():
     """Test RelationshipValidator with invalid relationship pairs."""
@@ -180,7 +213,7 @@ def test_validates_on_query_method():
 
         @classmethod
         def objects(cls):
-            return MockQuerySet(cls)
+            return MockQuerySet.for_model(cls)
 
     class QueryBook(RelationManagementMixin, BaseModel):
         id: int
@@ -189,10 +222,100 @@ def test_validates_on_query_method():
 
         @classmethod
         def objects(cls):
-            return MockQuerySet(cls)
+            return MockQuerySet.for_model(cls)
 
     author = QueryAuthor(id=1, name="Test")
 
     # Try to access the query property - should trigger validation
     with pytest.raises(ValueError, match="Inverse relationship .* not found"):
-        _ = author.book_query()
\ No newline at end of file
+        _ = author.book_query()
+
+def test_relationship_subclasses_are_valid_pairs():
+    """Test subclasses of the relation types pass pair validation."""
+
+    class OrderedHasMany(HasMany):
+        pass
+
+    class Shelf(RelationManagementMixin, BaseModel):
+        id: int
+        volumes: ClassVar[HasMany["Volume"]] = OrderedHasMany(
+            foreign_key="shelf_id",
+            inverse_of="shelf"
+        )
+
+    class Volume(RelationManagementMixin, BaseModel):
+        id: int
+        shelf_id: int
+        shelf: ClassVar[BelongsTo["Shelf"]] = BelongsTo(
+            foreign_key="shelf_id",
+            inverse_of="volumes"
+        )
+
+    assert Shelf.get_relation("volumes").get_related_model(Shelf) is Volume
+    assert Shelf(id=1).volumes() is None
+
+
+def test_missing_inverse_name_is_filled_in():
+    """Test validation sets inverse_of on the other side when it is omitted."""
+
+    class Keeper(RelationManagementMixin, BaseModel):
+        id: int
+        animals: ClassVar[HasMany["Animal"]] = HasMany(
+            foreign_key="keeper_id",
+            inverse_of="keeper"
+        )
+
+    class Animal(RelationManagementMixin, BaseModel):
+        id: int
+        keeper_id: int
+        keeper: ClassVar[BelongsTo["Keeper"]] = BelongsTo(foreign_key="keeper_id")
+
+    Keeper.get_relation("animals").get_related_model(Keeper)
+    assert Animal.get_relation("keeper").inverse_of == "animals"
+
+
+def test_validator_only_created_with_inverse():
+    """Test relations without inverse_of do not carry a validator."""
+    assert HasMany(foreign_key="author_id")._validator is None
+    assert BelongsTo("author_id", "books")._validator is not None
+
+
+def test_explicit_validator_is_kept():
+    """Test a validator passed by the caller is not replaced."""
+
+    class AcceptAll(RelationValidation):
+        def validate(self, owner, related_model):
+            pass
+
+    validator = AcceptAll()
+    for relation_type in (BelongsTo, HasOne, HasMany):
+        relation = relation_type(foreign_key="x", inverse_of="y", validator=validator)
+        assert relation._validator is validator
+
+
+def test_relation_descriptors_are_slotted():
+    """Test relation descriptors do not carry a per-instance __dict__."""
+    for relation in (BelongsTo("author_id"), HasOne("author_id"), HasMany("author_id")):
+        assert not hasattr(relation, "__dict__")
+
+
+def test_inverse_found_through_registered_relations():
+    """Test inverse lookup uses the related model's registered relations."""
+
+    class Gate(RelationManagementMixin, BaseModel):
+        id: int
+        keys: ClassVar[HasMany["GateKey"]] = HasMany(
+            foreign_key="gate_id",
+            inverse_of="gate"
+        )
+
+    class GateKey(RelationManagementMixin, BaseModel):
+        id: int
+        gate_id: int
+
+    # Registered without a class attribute of that name
+    GateKey.register_relation("gate", BelongsTo(foreign_key="gate_id", inverse_of="keys"))
+
+    relation = Gate.get_relation("keys")
+    assert relation.get_related_model(Gate) is GateKey
+    assert GateKey.get_relation("gate").inverse_of == "keys"
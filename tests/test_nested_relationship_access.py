@@ -1,6 +1,3 @@
-import time
-
-
 def test_nested_relationship_access(author, book, chapter):
     """Test accessing deeply nested relationships."""
     # First level relation access
@@ -24,7 +21,7 @@ def test_bidirectional_relationship_consistency(author, book):
     assert book_author.id == author.id
 
 
-def test_custom_loader_caching(author):
+def test_custom_loader_caching(author, fake_clock):
     """Test custom loader with caching."""
     # First access - should use loader
     books = author.books()
@@ -35,7 +32,7 @@ def test_custom_loader_caching(author):
     assert cached_books == books
 
     # Wait for TTL expiration
-    time.sleep(1.1)
+    fake_clock.advance(1.1)
 
     # Third access - should use loader again
     new_books = author.books()